@@ -252,7 +252,7 @@ def is_integer(x):
     return abs(x - round(x)) <= INTEGER_THRESHOLD
 
 
-def normalise(x, factor=1, clip=True):
+def normalise(x, factor=1, clip=True, axis=None):
     """
     Normalises given *array_like* :math:`x` variable values and optionally clip
     them between.
@@ -265,6 +265,9 @@ def normalise(x, factor=1, clip=True):
         Normalization factor
     clip : bool, optional
         Clip values between in domain [0, 'factor'].
+    axis : int, optional
+        Axis along which the maximum is computed, the whole array maximum is
+        used if not given.
 
     Returns
     -------
@@ -276,9 +279,14 @@ def normalise(x, factor=1, clip=True):
     >>> x = np.array([0.48224885, 0.31651974, 0.22070513])
     >>> normalise(x)  # doctest: +ELLIPSIS
     array([ 1.        ,  0.6563411...,  0.4576581...])
+    >>> x = np.array([[0.48224885, 0.31651974, 0.22070513],
+    ...               [0.24112442, 0.63303948, 0.11035256]])
+    >>> normalise(x, axis=-1)  # doctest: +ELLIPSIS
+    array([[ 1.        ,  0.6563411...,  0.4576581...],
+           [ 0.3808995...,  1.        ,  0.1743217...]])
     """
 
     x = to_ndarray(x)
-    maximum = np.max(x)
+    maximum = np.max(x, axis=axis, keepdims=True)
     x *= (1 / maximum) * factor
     return np.clip(x, 0, factor) if clip else x
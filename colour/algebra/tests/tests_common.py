@@ -199,6 +199,13 @@ class TestNormalise(unittest.TestCase):
                       clip=False),
             np.array([-2.26324069, -1.9805978, 1.]),
             decimal=7)
+        np.testing.assert_almost_equal(
+            normalise(np.array([[0.1151847498, 0.1008, 0.0508937252],
+                                [-0.1151847498, -0.1008, 0.0508937252]]),
+                      axis=-1),
+            np.array([[1., 0.87511585, 0.4418443],
+                      [0., 0., 1.]]),
+            decimal=7)
 
 
 if __name__ == '__main__':
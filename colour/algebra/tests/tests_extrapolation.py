@@ -34,6 +34,17 @@ class TestExtrapolator1d(unittest.TestCase):
     tests methods.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Initialises common tests attributes.
+        """
+
+        cls.__extrapolator = Extrapolator1d(
+            LinearInterpolator1d(
+                np.array([5, 6, 7]),
+                np.array([5, 6, 7])))
+
     def test_required_attributes(self):
         """
         Tests presence of required attributes.
@@ -60,10 +71,7 @@ class TestExtrapolator1d(unittest.TestCase):
         method.
         """
 
-        extrapolator = Extrapolator1d(
-            LinearInterpolator1d(
-                np.array([5, 6, 7]),
-                np.array([5, 6, 7])))
+        extrapolator = self.__extrapolator
         np.testing.assert_almost_equal(extrapolator([4, 8]), [4., 8.])
         self.assertEqual(extrapolator(4), 4.)
 
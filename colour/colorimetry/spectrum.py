@@ -595,8 +595,7 @@ class SpectralPowerDistribution(object):
         :attr:`SpectralPowerDistribution.values` is read only.
         """
 
-        return np.array([self.get(wavelength)
-                         for wavelength in self.wavelengths])
+        return np.array([value for _, value in sorted(self.__data.items())])
 
     @values.setter
     def values(self, value):
@@ -2045,8 +2044,7 @@ class TriSpectralPowerDistribution(object):
         :attr:`TriSpectralPowerDistribution.values` is read only.
         """
 
-        return np.array([self.get(wavelength)
-                         for wavelength in self.wavelengths])
+        return np.column_stack((self.x.values, self.y.values, self.z.values))
 
     @values.setter
     def values(self, value):
@@ -28,7 +28,9 @@ from .cie_uvw import XYZ_to_UVW
 from .rgb import XYZ_to_RGB, RGB_to_XYZ
 from .rgb import RGB_to_RGB
 from .common import XYZ_to_sRGB
-from .aces_rgb_idt import spectral_to_aces_relative_exposure_values
+from .aces_rgb_idt import (
+    spectral_to_aces_relative_exposure_values,
+    spectral_to_aces_relative_exposure_values_batch)
 from .ipt import XYZ_to_IPT, IPT_to_XYZ, IPT_hue_angle
 
 __all__ = ['RGB_Colourspace']
@@ -52,5 +54,6 @@ __all__ += ['XYZ_to_UVW']
 __all__ += ['XYZ_to_RGB', 'RGB_to_XYZ']
 __all__ += ['RGB_to_RGB']
 __all__ += ['XYZ_to_sRGB']
-__all__ += ['spectral_to_aces_relative_exposure_values']
+__all__ += ['spectral_to_aces_relative_exposure_values',
+            'spectral_to_aces_relative_exposure_values_batch']
 __all__ += ['XYZ_to_IPT', 'IPT_to_XYZ', 'IPT_hue_angle']
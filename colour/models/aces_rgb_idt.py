@@ -8,6 +8,7 @@ ACES RGB Colourspace - Input Device Transform
 Defines the *ACES RGB* colourspace *Input Device Transform* utilities:
 
 -   :func:`spectral_to_aces_relative_exposure_values`
+-   :func:`spectral_to_aces_relative_exposure_values_batch`
 
 See Also
 --------
@@ -29,6 +30,7 @@ import numpy as np
 
 from colour.colorimetry import ILLUMINANTS_RELATIVE_SPDS
 from colour.models import ACES_RICD
+from colour.utilities import is_numba_installed
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2014 - Colour Developers'
@@ -39,11 +41,121 @@ __status__ = 'Production'
 
 __all__ = ['FLARE_PERCENTAGE',
            'S_FLARE_FACTOR',
-           'spectral_to_aces_relative_exposure_values']
+           'spectral_to_aces_relative_exposure_values',
+           'spectral_to_aces_relative_exposure_values_batch']
 
 FLARE_PERCENTAGE = 0.00500
 S_FLARE_FACTOR = 0.18000 / (0.18000 + FLARE_PERCENTAGE)
 
+_ACES_RICD_BAR = np.ascontiguousarray(np.transpose(ACES_RICD.values))
+
+_ACES_REDUCE_KERNEL_CACHE = None
+
+
+def _aces_reduce_loop(spds, illuminant, ricd_bar):
+    """
+    Computes the illuminant normalised *ACES RICD* weighted sums of given
+    spectral power distributions values in a single pass over the wavelengths
+    axis.
+
+    The definition is written with explicit loops so that it can be compiled
+    with *numba*, see :def:`_aces_reduce`.
+
+    Parameters
+    ----------
+    spds : ndarray, (M, n)
+        Spectral power distributions values.
+    illuminant : ndarray, (n,)
+        *Illuminant* spectral power distribution values.
+    ricd_bar : ndarray, (3, n)
+        *ACES RICD* colour matching functions values.
+
+    Returns
+    -------
+    ndarray, (M, 3)
+        Illuminant normalised weighted sums.
+    """
+
+    m, n = spds.shape
+    E_rgb = np.zeros((m, 3))
+    k = np.zeros(3)
+    for c in range(3):
+        for i in range(n):
+            k[c] += illuminant[i] * ricd_bar[c, i]
+
+    for j in range(m):
+        for c in range(3):
+            E = 0.0
+            for i in range(n):
+                E += illuminant[i] * spds[j, i] * ricd_bar[c, i]
+
+            E_rgb[j, c] = E / k[c]
+
+    return E_rgb
+
+
+def _aces_reduce_numpy(spds, illuminant, ricd_bar):
+    """
+    Computes the illuminant normalised *ACES RICD* weighted sums of given
+    spectral power distributions values using *Numpy*.
+
+    Parameters
+    ----------
+    spds : ndarray, (M, n)
+        Spectral power distributions values.
+    illuminant : ndarray, (n,)
+        *Illuminant* spectral power distribution values.
+    ricd_bar : ndarray, (3, n)
+        *ACES RICD* colour matching functions values.
+
+    Returns
+    -------
+    ndarray, (M, 3)
+        Illuminant normalised weighted sums.
+    """
+
+    k = 1 / np.dot(ricd_bar, illuminant)
+
+    return k * np.dot(spds * illuminant, ricd_bar.T)
+
+
+def _aces_reduce(spds, illuminant, ricd_bar):
+    """
+    Computes the illuminant normalised *ACES RICD* weighted sums of given
+    spectral power distributions values.
+
+    If *numba* is installed, :def:`_aces_reduce_loop` definition is compiled
+    on first call, :def:`_aces_reduce_numpy` definition is used otherwise.
+    *numba* is thus only imported when needed and not by :mod:`colour`.
+
+    Parameters
+    ----------
+    spds : ndarray, (M, n)
+        Spectral power distributions values.
+    illuminant : ndarray, (n,)
+        *Illuminant* spectral power distribution values.
+    ricd_bar : ndarray, (3, n)
+        *ACES RICD* colour matching functions values.
+
+    Returns
+    -------
+    ndarray, (M, 3)
+        Illuminant normalised weighted sums.
+    """
+
+    global _ACES_REDUCE_KERNEL_CACHE
+
+    if _ACES_REDUCE_KERNEL_CACHE is None:
+        if is_numba_installed():
+            from numba import njit
+
+            _ACES_REDUCE_KERNEL_CACHE = njit(
+                cache=True, fastmath=True)(_aces_reduce_loop)
+        else:
+            _ACES_REDUCE_KERNEL_CACHE = _aces_reduce_numpy
+
+    return _ACES_REDUCE_KERNEL_CACHE(spds, illuminant, ricd_bar)
+
 
 def spectral_to_aces_relative_exposure_values(
         spd,
@@ -88,27 +200,77 @@ def spectral_to_aces_relative_exposure_values(
     if spd.shape != ACES_RICD.shape:
         spd = spd.clone().align(shape)
 
-    if illuminant.shape != ACES_RICD.shape:
-        illuminant = illuminant.clone().align(shape)
+    return spectral_to_aces_relative_exposure_values_batch(spd.values,
+                                                           illuminant)
 
-    spd = spd.values
-    illuminant = illuminant.values
 
-    r_bar, g_bar, b_bar = (ACES_RICD.r_bar.values,
-                           ACES_RICD.g_bar.values,
-                           ACES_RICD.b_bar.values)
+def spectral_to_aces_relative_exposure_values_batch(
+        spds,
+        illuminant=ILLUMINANTS_RELATIVE_SPDS.get('D60')):
+    """
+    Converts given spectral power distributions values to *ACES RGB*
+    colourspace relative exposure values.
 
-    k = lambda x, y: 1 / np.sum(x * y)
+    The spectral power distributions values are expected to be sampled
+    according to :attr:`colour.models.dataset.aces_rgb_idt.ACES_RICD` shape
+    so that the whole batch is converted with a single matrix product.
 
-    k_r = k(illuminant, r_bar)
-    k_g = k(illuminant, g_bar)
-    k_b = k(illuminant, b_bar)
+    Parameters
+    ----------
+    spds : array_like, (n,) or (M, n)
+        Spectral power distributions values.
+    illuminant : SpectralPowerDistribution, optional
+        *Illuminant* spectral power distribution.
+
+    Returns
+    -------
+    ndarray, (3,) or (M, 3)
+        *ACES RGB* colourspace relative exposure values matrix.
+
+    Raises
+    ------
+    ValueError
+        If the spectral power distributions values count doesn't match the
+        *ACES RICD* wavelengths count.
+
+    Notes
+    -----
+    -   Output *ACES RGB* colourspace relative exposure values matrix is in
+        domain [0, 1].
+
+    See Also
+    --------
+    spectral_to_aces_relative_exposure_values
+
+    Examples
+    --------
+    >>> from colour import ACES_RICD, COLOURCHECKERS_SPDS
+    >>> spds = [COLOURCHECKERS_SPDS['ColorChecker N Ohta'][name]
+    ...         for name in ('dark skin', 'light skin')]
+    >>> spds = [spd.clone().align(ACES_RICD.shape).values for spd in spds]
+    >>> spectral_to_aces_relative_exposure_values_batch(spds)  # noqa  # doctest: +ELLIPSIS
+    array([[ 0.1187697...,  0.0870866...,  0.0589442...],
+           [ 0.4000236...,  0.3191478...,  0.2373479...]])
+    """
+
+    spds = np.asarray(spds)
+    if spds.shape[-1] != len(ACES_RICD):
+        raise ValueError(
+            ('"{0}" spectral power distributions values count is different '
+             'from "ACES RICD" wavelengths count: "{1}"!').format(
+                spds.shape[-1], len(ACES_RICD)))
+
+    shape = ACES_RICD.shape
+    if illuminant.shape != ACES_RICD.shape:
+        illuminant = illuminant.clone().align(shape)
 
-    E_r = k_r * np.sum(illuminant * spd * r_bar)
-    E_g = k_g * np.sum(illuminant * spd * g_bar)
-    E_b = k_b * np.sum(illuminant * spd * b_bar)
+    illuminant = np.ascontiguousarray(illuminant.values, dtype=np.float_)
+    values = np.ascontiguousarray(spds, dtype=np.float_)
 
-    E_rgb = np.array([E_r, E_g, E_b])
+    E_rgb = _aces_reduce(values.reshape(-1, len(ACES_RICD)),
+                         illuminant,
+                         _ACES_RICD_BAR)
+    E_rgb = E_rgb.reshape(spds.shape[:-1] + (3,))
 
     # Accounting for flare.
     E_rgb += FLARE_PERCENTAGE
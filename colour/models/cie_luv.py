@@ -200,12 +200,12 @@ def Luv_uv_to_xy(uv):
 
     Parameters
     ----------
-    uv : array_like
+    uv : array_like, (2,) or (M, 2)
         *CIE Luv u"v"* chromaticity coordinates.
 
     Returns
     -------
-    tuple
+    tuple or ndarray, (M, 2)
         *xy* chromaticity coordinates.
 
     Notes
@@ -225,8 +225,13 @@ def Luv_uv_to_xy(uv):
     (0.2233388..., 0.1532803...)
     """
 
-    return (9 * uv[0] / (6 * uv[0] - 16 * uv[1] + 12), 4 * uv[1] /
-            (6 * uv[0] - 16 * uv[1] + 12))
+    uv = np.asarray(uv)
+    u, v = uv[..., 0], uv[..., 1]
+
+    x = 9 * u / (6 * u - 16 * v + 12)
+    y = 4 * v / (6 * u - 16 * v + 12)
+
+    return (x, y) if uv.ndim == 1 else np.column_stack((x, y))
 
 
 def Luv_to_LCHuv(Luv):
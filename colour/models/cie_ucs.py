@@ -159,12 +159,12 @@ def UCS_uv_to_xy(uv):
 
     Parameters
     ----------
-    uv : array_like
+    uv : array_like, (2,) or (M, 2)
         *CIE UCS uv* chromaticity coordinates.
 
     Returns
     -------
-    tuple
+    tuple or ndarray, (M, 2)
         *xy* chromaticity coordinates.
 
     Notes
@@ -184,5 +184,10 @@ def UCS_uv_to_xy(uv):
     (0.7072386..., 0.4129510...)
     """
 
-    return (3 * uv[0] / (2 * uv[0] - 8 * uv[1] + 4),
-            2 * uv[1] / (2 * uv[0] - 8 * uv[1] + 4))
+    uv = np.asarray(uv)
+    u, v = uv[..., 0], uv[..., 1]
+
+    x = 3 * u / (2 * u - 8 * v + 4)
+    y = 2 * v / (2 * u - 8 * v + 4)
+
+    return (x, y) if uv.ndim == 1 else np.column_stack((x, y))
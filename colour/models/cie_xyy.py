@@ -130,12 +130,12 @@ def xy_to_XYZ(xy):
 
     Parameters
     ----------
-    xy : array_like
+    xy : array_like, (2,) or (M, 2)
         *xy* chromaticity coordinates.
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (3,) or (M, 3)
         *CIE XYZ* colourspace matrix.
 
     Notes
@@ -147,9 +147,25 @@ def xy_to_XYZ(xy):
     --------
     >>> xy_to_XYZ((0.25, 0.25))
     array([ 1.,  1.,  2.])
+    >>> xy_to_XYZ(np.array([[0.25, 0.25], [0.5, 0.25]]))
+    array([[ 1.,  1.,  2.],
+           [ 2.,  1.,  1.]])
     """
 
-    return xyY_to_XYZ(np.array([xy[0], xy[1], 1]))
+    xy = np.asarray(xy)
+    if xy.ndim == 1:
+        return xyY_to_XYZ(np.array([xy[0], xy[1], 1]))
+
+    x, y = xy[..., 0], xy[..., 1]
+
+    # Matching :def:`xyY_to_XYZ` definition, *y* equal to zero yields a
+    # black *CIE XYZ* colourspace matrix.
+    black = y == 0
+    y = np.where(black, 1, y)
+
+    return np.column_stack((np.where(black, 0, x / y),
+                            np.where(black, 0, 1),
+                            np.where(black, 0, (1 - x - y) / y)))
 
 
 def XYZ_to_xy(XYZ,
@@ -38,7 +38,7 @@ def XYZ_to_sRGB(XYZ,
 
     Parameters
     ----------
-    XYZ : array_like, (3,)
+    XYZ : array_like, (3,) or (M, 3)
         *CIE XYZ* colourspace matrix.
     illuminant : array_like, optional
         Source illuminant chromaticity coordinates.
@@ -50,7 +50,7 @@ def XYZ_to_sRGB(XYZ,
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (3,) or (M, 3)
         *sRGB* colour matrix.
 
     Notes
@@ -65,9 +65,11 @@ def XYZ_to_sRGB(XYZ,
     """
 
     sRGB = RGB_COLOURSPACES.get('sRGB')
-    return XYZ_to_RGB(XYZ,
-                      illuminant,
-                      sRGB.whitepoint,
-                      sRGB.to_RGB,
-                      chromatic_adaptation_method,
-                      sRGB.transfer_function if transfer_function else None)
+    RGB = XYZ_to_RGB(XYZ,
+                     illuminant,
+                     sRGB.whitepoint,
+                     sRGB.to_RGB,
+                     chromatic_adaptation_method)
+
+    # *sRGB* transfer function is vectorised thus applied to the whole array.
+    return sRGB.transfer_function(RGB) if transfer_function else RGB
@@ -25,7 +25,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.colorimetry import ILLUMINANTS
-from colour.models import RGB_Colourspace, normalised_primary_matrix
+from colour.models import RGB_Colourspace
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2014 - Colour Developers'
@@ -40,6 +40,8 @@ __all__ = ['ADOBE_WIDE_GAMUT_RGB_PRIMARIES',
            'XYZ_TO_ADOBE_WIDE_GAMUT_RGB_MATRIX',
            'ADOBE_WIDE_GAMUT_RGB_TRANSFER_FUNCTION',
            'ADOBE_WIDE_GAMUT_RGB_INVERSE_TRANSFER_FUNCTION',
+           'ADOBE_WIDE_GAMUT_RGB_TRANSFER_FUNCTION_8_BIT_LUT',
+           'adobe_wide_gamut_rgb_transfer_function_8_bit',
            'ADOBE_WIDE_GAMUT_RGB_COLOURSPACE']
 
 ADOBE_WIDE_GAMUT_RGB_PRIMARIES = np.array(
@@ -60,37 +62,116 @@ ADOBE_WIDE_GAMUT_RGB_WHITEPOINT = ILLUMINANTS.get(
 ADOBE_WIDE_GAMUT_RGB_WHITEPOINT : tuple
 """
 
-ADOBE_WIDE_GAMUT_RGB_TO_XYZ_MATRIX = normalised_primary_matrix(
-    ADOBE_WIDE_GAMUT_RGB_PRIMARIES,
-    ADOBE_WIDE_GAMUT_RGB_WHITEPOINT)
+ADOBE_WIDE_GAMUT_RGB_TO_XYZ_MATRIX = np.array(
+    [[0.71639665, 0.10102557, 0.14678978],
+     [0.25869066, 0.72471815, 0.01659118],
+     [0.00000000, 0.05121435, 0.77397393]])
 """
 *Adobe Wide Gamut RGB* colourspace to *CIE XYZ* colourspace matrix.
 
 ADOBE_WIDE_GAMUT_RGB_TO_XYZ_MATRIX : array_like, (3, 3)
 """
 
-XYZ_TO_ADOBE_WIDE_GAMUT_RGB_MATRIX = np.linalg.inv(
-    ADOBE_WIDE_GAMUT_RGB_TO_XYZ_MATRIX)
+XYZ_TO_ADOBE_WIDE_GAMUT_RGB_MATRIX = np.array(
+    [[1.46251660, -0.18455244, -0.27342077],
+     [-0.52284241, 1.44791680, 0.06812280],
+     [0.03459682, -0.09580958, 1.28752545]])
 """
 *CIE XYZ* colourspace to *Adobe Wide Gamut RGB* colourspace matrix.
 
 XYZ_TO_ADOBE_WIDE_GAMUT_RGB_MATRIX : array_like, (3, 3)
 """
 
-ADOBE_WIDE_GAMUT_RGB_TRANSFER_FUNCTION = lambda x: x ** (1 / (563 / 256))
+
+def _adobe_wide_gamut_rgb_transfer_function(value):
+    """
+    Defines the *Adobe Wide Gamut RGB* colourspace transfer function.
+
+    Parameters
+    ----------
+    value : numeric or array_like
+        value.
+
+    Returns
+    -------
+    numeric or ndarray
+        Companded value.
+    """
+
+    return np.power(np.maximum(value, 0), 1 / (563 / 256))
+
+
+def _adobe_wide_gamut_rgb_inverse_transfer_function(value):
+    """
+    Defines the *Adobe Wide Gamut RGB* colourspace inverse transfer function.
+
+    Parameters
+    ----------
+    value : numeric or array_like
+        value.
+
+    Returns
+    -------
+    numeric or ndarray
+        Companded value.
+    """
+
+    return np.power(np.maximum(value, 0), 563 / 256)
+
+
+ADOBE_WIDE_GAMUT_RGB_TRANSFER_FUNCTION = (
+    _adobe_wide_gamut_rgb_transfer_function)
 """
 Transfer function from linear to *Adobe Wide Gamut RGB* colourspace.
 
 ADOBE_WIDE_GAMUT_RGB_TRANSFER_FUNCTION : object
 """
 
-ADOBE_WIDE_GAMUT_RGB_INVERSE_TRANSFER_FUNCTION = lambda x: x ** (563 / 256)
+ADOBE_WIDE_GAMUT_RGB_INVERSE_TRANSFER_FUNCTION = (
+    _adobe_wide_gamut_rgb_inverse_transfer_function)
 """
 Inverse transfer function from *Adobe Wide Gamut RGB* colourspace to linear.
 
 ADOBE_WIDE_GAMUT_RGB_INVERSE_TRANSFER_FUNCTION : object
 """
 
+ADOBE_WIDE_GAMUT_RGB_TRANSFER_FUNCTION_8_BIT_LUT = np.around(
+    np.clip(ADOBE_WIDE_GAMUT_RGB_TRANSFER_FUNCTION(np.arange(256) / 255),
+            0,
+            1) * 255).astype(np.uint8)
+"""
+*Adobe Wide Gamut RGB* colourspace transfer function 8 bit lookup table.
+
+ADOBE_WIDE_GAMUT_RGB_TRANSFER_FUNCTION_8_BIT_LUT : ndarray, (256,)
+"""
+
+
+def adobe_wide_gamut_rgb_transfer_function_8_bit(value):
+    """
+    Applies the *Adobe Wide Gamut RGB* colourspace transfer function to given
+    8 bit integer value using
+    :attr:`ADOBE_WIDE_GAMUT_RGB_TRANSFER_FUNCTION_8_BIT_LUT` attribute lookup
+    table.
+
+    Parameters
+    ----------
+    value : integer or array_like
+        8 bit integer value in domain [0, 255].
+
+    Returns
+    -------
+    integer or ndarray
+        8 bit integer companded value.
+
+    Examples
+    --------
+    >>> adobe_wide_gamut_rgb_transfer_function_8_bit(np.array([0, 64, 128, 255]))  # noqa
+    array([  0, 136, 186, 255], dtype=uint8)
+    """
+
+    return np.take(ADOBE_WIDE_GAMUT_RGB_TRANSFER_FUNCTION_8_BIT_LUT, value)
+
+
 ADOBE_WIDE_GAMUT_RGB_COLOURSPACE = RGB_Colourspace(
     'Adobe Wide Gamut RGB',
     ADOBE_WIDE_GAMUT_RGB_PRIMARIES,
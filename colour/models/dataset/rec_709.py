@@ -42,6 +42,8 @@ __all__ = ['REC_709_PRIMARIES',
            'XYZ_TO_REC_709_MATRIX',
            'REC_709_TRANSFER_FUNCTION',
            'REC_709_INVERSE_TRANSFER_FUNCTION',
+           'REC_709_TRANSFER_FUNCTION_8_BIT_LUT',
+           'rec_709_transfer_function_8_bit',
            'REC_709_COLOURSPACE']
 
 REC_709_PRIMARIES = np.array(
@@ -72,29 +74,109 @@ REC_709_TO_XYZ_MATRIX = np.array(
 REC_709_TO_XYZ_MATRIX : array_like, (3, 3)
 """
 
-XYZ_TO_REC_709_MATRIX = np.linalg.inv(REC_709_TO_XYZ_MATRIX)
+XYZ_TO_REC_709_MATRIX = np.array(
+    [[3.24100326, -1.53739899, -0.49861587],
+     [-0.96922426, 1.87592999, 0.04155422],
+     [0.05563942, -0.2040112, 1.05714897]])
 """
 *CIE XYZ* colourspace to *Rec. 709* colourspace matrix.
 
 XYZ_TO_REC_709_MATRIX : array_like, (3, 3)
 """
 
-REC_709_TRANSFER_FUNCTION = lambda x: (
-    x * 4.5 if x < 0.018 else 1.099 * (x ** 0.45) - 0.099)
+
+def _rec_709_transfer_function(value):
+    """
+    Defines the *Rec. 709* colourspace transfer function.
+
+    Parameters
+    ----------
+    value : numeric or array_like
+        value.
+
+    Returns
+    -------
+    numeric or ndarray
+        Companded value.
+    """
+
+    value = np.asarray(value)
+    return np.where(value < 0.018,
+                    value * 4.5,
+                    1.099 * np.power(np.maximum(value, 0), 0.45) - 0.099)
+
+
+def _rec_709_inverse_transfer_function(value):
+    """
+    Defines the *Rec. 709* colourspace inverse transfer function.
+
+    Parameters
+    ----------
+    value : numeric or array_like
+        value.
+
+    Returns
+    -------
+    numeric or ndarray
+        Companded value.
+    """
+
+    value = np.asarray(value)
+    return np.where(value < 0.081,
+                    value / 4.5,
+                    np.power((np.maximum(value, 0) + 0.099) / 1.099,
+                             1 / 0.45))
+
+
+REC_709_TRANSFER_FUNCTION = _rec_709_transfer_function
 """
 Transfer function from linear to *Rec. 709* colourspace.
 
 REC_709_TRANSFER_FUNCTION : object
 """
 
-REC_709_INVERSE_TRANSFER_FUNCTION = lambda x: (
-    x / 4.5 if x < 0.018 else ((x + 0.099) / 1.099) ** (1 / 0.45))
+REC_709_INVERSE_TRANSFER_FUNCTION = _rec_709_inverse_transfer_function
 """
 Inverse transfer function from *Rec. 709* colourspace to linear.
 
 REC_709_INVERSE_TRANSFER_FUNCTION : object
 """
 
+REC_709_TRANSFER_FUNCTION_8_BIT_LUT = np.around(
+    np.clip(REC_709_TRANSFER_FUNCTION(np.arange(256) / 255), 0, 1) *
+    255).astype(np.uint8)
+"""
+*Rec. 709* colourspace transfer function 8 bit lookup table.
+
+REC_709_TRANSFER_FUNCTION_8_BIT_LUT : ndarray, (256,)
+"""
+
+
+def rec_709_transfer_function_8_bit(value):
+    """
+    Applies the *Rec. 709* colourspace transfer function to given 8 bit
+    integer value using :attr:`REC_709_TRANSFER_FUNCTION_8_BIT_LUT`
+    attribute lookup table.
+
+    Parameters
+    ----------
+    value : integer or array_like
+        8 bit integer value in domain [0, 255].
+
+    Returns
+    -------
+    integer or ndarray
+        8 bit integer companded value.
+
+    Examples
+    --------
+    >>> rec_709_transfer_function_8_bit(np.array([0, 64, 128, 255]))
+    array([  0, 125, 180, 255], dtype=uint8)
+    """
+
+    return np.take(REC_709_TRANSFER_FUNCTION_8_BIT_LUT, value)
+
+
 REC_709_COLOURSPACE = RGB_Colourspace(
     'Rec. 709',
     REC_709_PRIMARIES,
@@ -36,6 +36,42 @@ __all__ = ['XYZ_to_RGB',
            'RGB_to_RGB']
 
 
+def _tristimulus_array(values):
+    """
+    Returns given colourspace matrix or matrices as an array whose last axis
+    holds the three components.
+
+    Given values holding exactly three components, e.g. a column vector of
+    shape (3, 1), are returned with shape (3,).
+
+    Parameters
+    ----------
+    values : array_like, (3,) or (M, 3)
+        Colourspace matrix or matrices.
+
+    Returns
+    -------
+    ndarray, (3,) or (M, 3)
+        Colourspace matrix or matrices.
+
+    Raises
+    ------
+    ValueError
+        If the last axis of given values doesn't hold three components.
+    """
+
+    values = np.asarray(values)
+    if values.size == 3:
+        return np.ravel(values)
+
+    if values.shape[-1] != 3:
+        raise ValueError(
+            '"{0}" shaped values last axis must hold "3" components!'.format(
+                values.shape))
+
+    return values
+
+
 def XYZ_to_RGB(XYZ,
                illuminant_XYZ,
                illuminant_RGB,
@@ -49,7 +85,7 @@ def XYZ_to_RGB(XYZ,
 
     Parameters
     ----------
-    XYZ : array_like, (3,)
+    XYZ : array_like, (3,) or (M, 3)
         *CIE XYZ* colourspace matrix.
     illuminant_XYZ : array_like
         *CIE XYZ* colourspace *illuminant* *xy* chromaticity coordinates.
@@ -65,7 +101,7 @@ def XYZ_to_RGB(XYZ,
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (3,) or (M, 3)
         *RGB* colourspace matrix.
 
     Notes
@@ -100,18 +136,21 @@ def XYZ_to_RGB(XYZ,
         [3.24100326, -1.53739899, -0.49861587],
         [-0.96922426, 1.87592999, 0.04155422],
         [0.05563942, -0.2040112, 1.05714897]])
+    XYZ = _tristimulus_array(XYZ)
+
     cat = chromatic_adaptation_matrix(xy_to_XYZ(illuminant_XYZ),
                                       xy_to_XYZ(illuminant_RGB),
                                       method=chromatic_adaptation_method)
 
-    adapted_XYZ = np.dot(cat, XYZ)
+    adapted_XYZ = np.einsum('ij,...j->...i', cat, XYZ)
 
-    RGB = np.dot(to_RGB.reshape((3, 3)), adapted_XYZ.reshape((3, 1)))
+    RGB = np.einsum('ij,...j->...i', to_RGB.reshape((3, 3)), adapted_XYZ)
 
     if transfer_function is not None:
-        RGB = np.array([transfer_function(x) for x in np.ravel(RGB)])
+        RGB = np.reshape([transfer_function(x) for x in np.ravel(RGB)],
+                         RGB.shape)
 
-    return np.ravel(RGB)
+    return RGB
 
 
 def RGB_to_XYZ(RGB,
@@ -127,7 +166,7 @@ def RGB_to_XYZ(RGB,
 
     Parameters
     ----------
-    RGB : array_like, (3,)
+    RGB : array_like, (3,) or (M, 3)
         *RGB* colourspace matrix.
     illuminant_RGB : array_like
         *RGB* colourspace *illuminant* chromaticity coordinates.
@@ -143,7 +182,7 @@ def RGB_to_XYZ(RGB,
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (3,) or (M, 3)
         *CIE XYZ* colourspace matrix.
 
     Notes
@@ -174,20 +213,22 @@ def RGB_to_XYZ(RGB,
     array([ 0.1151847...,  0.1008    ,  0.0508937...])
     """
 
+    RGB = _tristimulus_array(RGB)
     if inverse_transfer_function is not None:
-        RGB = np.array([inverse_transfer_function(x)
-                        for x in np.ravel(RGB)])
+        RGB = np.reshape([inverse_transfer_function(x)
+                          for x in np.ravel(RGB)],
+                         RGB.shape)
 
-    XYZ = np.dot(to_XYZ.reshape((3, 3)), RGB.reshape((3, 1)))
+    XYZ = np.einsum('ij,...j->...i', to_XYZ.reshape((3, 3)), RGB)
 
     cat = chromatic_adaptation_matrix(
         xy_to_XYZ(illuminant_RGB),
         xy_to_XYZ(illuminant_XYZ),
         method=chromatic_adaptation_method)
 
-    adapted_XYZ = np.dot(cat, XYZ.reshape((3, 1)))
+    adapted_XYZ = np.einsum('ij,...j->...i', cat, XYZ)
 
-    return np.ravel(adapted_XYZ)
+    return adapted_XYZ
 
 
 def RGB_to_RGB(RGB,
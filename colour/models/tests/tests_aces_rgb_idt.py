@@ -19,7 +19,15 @@ from colour.characterisation import COLOURCHECKERS_SPDS
 from colour.colorimetry import (
     constant_spd,
     ones_spd)
-from colour.models import ACES_RICD, spectral_to_aces_relative_exposure_values
+from colour.models import (
+    ACES_RICD,
+    spectral_to_aces_relative_exposure_values,
+    spectral_to_aces_relative_exposure_values_batch)
+from colour.models.aces_rgb_idt import (
+    _ACES_RICD_BAR,
+    _aces_reduce_loop,
+    _aces_reduce_numpy)
+from colour.utilities import is_numba_installed
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2014 - Colour Developers'
@@ -28,7 +36,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestSpectralToAcesRelativeExposureValues']
+__all__ = ['TestSpectralToAcesRelativeExposureValues',
+           'TestSpectralToAcesRelativeExposureValuesBatch',
+           'TestAcesReduce']
 
 
 class TestSpectralToAcesRelativeExposureValues(unittest.TestCase):
@@ -63,5 +73,86 @@ class TestSpectralToAcesRelativeExposureValues(unittest.TestCase):
             np.array([0.11876978, 0.08708666, 0.0589442]))
 
 
+class TestSpectralToAcesRelativeExposureValuesBatch(unittest.TestCase):
+    """
+    Defines
+    :func:`colour.models.aces_rgb_idt.spectral_to_aces_relative_exposure_values_batch`  # noqa
+    definition unit tests methods.
+    """
+
+    def test_spectral_to_aces_relative_exposure_values_batch(self):
+        """
+        Tests
+        :func:`colour.models.aces_rgb_idt.spectral_to_aces_relative_exposure_values_batch`  # noqa
+        definition.
+        """
+
+        shape = ACES_RICD.shape
+        spds = [constant_spd(0.18, shape),
+                ones_spd(shape),
+                COLOURCHECKERS_SPDS.get('ColorChecker N Ohta').get(
+                    'dark skin').clone().align(shape)]
+
+        np.testing.assert_almost_equal(
+            spectral_to_aces_relative_exposure_values_batch(
+                [spd.values for spd in spds]),
+            np.array([[0.18, 0.18, 0.18],
+                      [0.97783784, 0.97783784, 0.97783784],
+                      [0.11876978, 0.08708666, 0.0589442]]))
+
+        np.testing.assert_almost_equal(
+            spectral_to_aces_relative_exposure_values_batch(spds[0].values),
+            np.array([0.18, 0.18, 0.18]))
+
+        self.assertRaises(ValueError,
+                          spectral_to_aces_relative_exposure_values_batch,
+                          np.ones((2, 3)))
+
+
+class TestAcesReduce(unittest.TestCase):
+    """
+    Defines :func:`colour.models.aces_rgb_idt._aces_reduce` definition
+    implementations unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        random_state = np.random.RandomState(4)
+        self.__spds = random_state.random_sample((5, len(ACES_RICD)))
+        self.__illuminant = random_state.random_sample(len(ACES_RICD))
+
+    def test_aces_reduce_loop(self):
+        """
+        Tests :func:`colour.models.aces_rgb_idt._aces_reduce_loop` definition
+        against :func:`colour.models.aces_rgb_idt._aces_reduce_numpy`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            _aces_reduce_loop(
+                self.__spds, self.__illuminant, _ACES_RICD_BAR),
+            _aces_reduce_numpy(
+                self.__spds, self.__illuminant, _ACES_RICD_BAR))
+
+    @unittest.skipUnless(is_numba_installed(), '"numba" is not installed!')
+    def test_aces_reduce_numba(self):
+        """
+        Tests :func:`colour.models.aces_rgb_idt._aces_reduce_loop` definition
+        compiled with *numba* against
+        :func:`colour.models.aces_rgb_idt._aces_reduce_numpy` definition.
+        """
+
+        from numba import njit
+
+        np.testing.assert_almost_equal(
+            njit(fastmath=True)(_aces_reduce_loop)(
+                self.__spds, self.__illuminant, _ACES_RICD_BAR),
+            _aces_reduce_numpy(
+                self.__spds, self.__illuminant, _ACES_RICD_BAR))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -252,6 +252,13 @@ class TestLuv_uv_to_xy(unittest.TestCase):
             (0.2455958975694641, 0.2424039944946324),
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            Luv_uv_to_xy(np.array([[0.20048615, 0.46549038],
+                                   [0.18133000, 0.40269000]])),
+            np.array([[0.31352792378977895, 0.32353408235422665],
+                      [0.2455958975694641, 0.2424039944946324]]),
+            decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
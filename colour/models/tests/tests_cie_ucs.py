@@ -137,6 +137,13 @@ class TestUCS_uv_to_xy(unittest.TestCase):
             (0.4474327628361858, 0.40749796251018744),
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            UCS_uv_to_xy(np.array([[0.20337333, 0.31405000],
+                                   [0.25585460, 0.34952814]])),
+            np.array([[0.32207410281368043, 0.33156550013623537],
+                      [0.4474327628361858, 0.40749796251018744]]),
+            decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -111,6 +111,15 @@ class Testxy_to_XYZ(unittest.TestCase):
             np.array([1.098, 1.000, 0.356]),
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            xy_to_XYZ(np.array([[0.32207410281368043, 0.3315655001362353],
+                                [0.4474327628361859, 0.4074979625101875],
+                                [0.3, 0.0]])),
+            np.array([[0.97137399, 1., 1.04462134],
+                      [1.098, 1.000, 0.356],
+                      [0, 0, 0]]),
+            decimal=7)
+
 
 class TestXYZ_to_xy(unittest.TestCase):
     """
@@ -231,6 +231,42 @@ class TestXYZ_to_RGB(unittest.TestCase):
                 RGB,
                 decimal=7)
 
+        to_RGB = np.array(
+            [3.24100326, -1.53739899, -0.49861587,
+             -0.96922426, 1.87592999, 0.04155422,
+             0.05563942, -0.2040112, 1.05714897])
+        np.testing.assert_almost_equal(
+            XYZ_to_RGB(
+                np.array([XYZ for xyY, XYZ, RGB in
+                          sRGB_LINEAR_COLORCHECKER_2005]),
+                (0.34567, 0.35850),
+                (0.31271, 0.32902),
+                to_RGB,
+                'Bradford',
+                sRGB_TRANSFER_FUNCTION),
+            np.array([RGB for xyY, XYZ, RGB in
+                      sRGB_LINEAR_COLORCHECKER_2005]),
+            decimal=7)
+
+        xyY, XYZ, RGB = sRGB_LINEAR_COLORCHECKER_2005[0]
+        np.testing.assert_almost_equal(
+            XYZ_to_RGB(
+                np.reshape(XYZ, (3, 1)),
+                (0.34567, 0.35850),
+                (0.31271, 0.32902),
+                to_RGB,
+                'Bradford',
+                sRGB_TRANSFER_FUNCTION),
+            RGB,
+            decimal=7)
+
+        self.assertRaises(ValueError,
+                          XYZ_to_RGB,
+                          np.ones((3, 2)),
+                          (0.34567, 0.35850),
+                          (0.31271, 0.32902),
+                          to_RGB)
+
 
 class TestRGB_to_XYZ(unittest.TestCase):
     """
@@ -271,6 +307,42 @@ class TestRGB_to_XYZ(unittest.TestCase):
                 np.array(XYZ),
                 decimal=7)
 
+        to_XYZ = np.array(
+            [0.41238656, 0.35759149, 0.18045049,
+             0.21263682, 0.71518298, 0.0721802,
+             0.01933062, 0.11919716, 0.95037259])
+        np.testing.assert_almost_equal(
+            RGB_to_XYZ(
+                np.array([RGB for xyY, XYZ, RGB in
+                          sRGB_LINEAR_COLORCHECKER_2005]),
+                (0.31271, 0.32902),
+                (0.34567, 0.35850),
+                to_XYZ,
+                'Bradford',
+                sRGB_INVERSE_TRANSFER_FUNCTION),
+            np.array([XYZ for xyY, XYZ, RGB in
+                      sRGB_LINEAR_COLORCHECKER_2005]),
+            decimal=7)
+
+        xyY, XYZ, RGB = sRGB_LINEAR_COLORCHECKER_2005[0]
+        np.testing.assert_almost_equal(
+            RGB_to_XYZ(
+                np.reshape(RGB, (3, 1)),
+                (0.31271, 0.32902),
+                (0.34567, 0.35850),
+                to_XYZ,
+                'Bradford',
+                sRGB_INVERSE_TRANSFER_FUNCTION),
+            np.array(XYZ),
+            decimal=7)
+
+        self.assertRaises(ValueError,
+                          RGB_to_XYZ,
+                          np.ones((3, 2)),
+                          (0.31271, 0.32902),
+                          (0.34567, 0.35850),
+                          to_XYZ)
+
 
 class TestRGB_to_RGB(unittest.TestCase):
     """
@@ -7,6 +7,7 @@ Defines unit tests for :mod:`colour.models.rgb_colourspace` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import sys
 
 if sys.version_info[:2] <= (2, 6):
@@ -14,7 +15,13 @@ if sys.version_info[:2] <= (2, 6):
 else:
     import unittest
 
-from colour.models import RGB_Colourspace
+from colour.models import (
+    RGB_COLOURSPACES,
+    RGB_Colourspace,
+    normalised_primary_matrix)
+from colour.models.dataset.adobe_wide_gamut_rgb import (
+    adobe_wide_gamut_rgb_transfer_function_8_bit)
+from colour.models.dataset.rec_709 import rec_709_transfer_function_8_bit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2014 - Colour Developers'
@@ -23,7 +30,8 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestRGB_Colourspace']
+__all__ = ['TestRGB_Colourspace',
+           'TestRGB_COLOURSPACES']
 
 
 class TestRGB_Colourspace(unittest.TestCase):
@@ -49,5 +57,71 @@ class TestRGB_Colourspace(unittest.TestCase):
             self.assertIn(attribute, dir(RGB_Colourspace))
 
 
+class TestRGB_COLOURSPACES(unittest.TestCase):
+    """
+    Defines :attr:`colour.models.dataset.RGB_COLOURSPACES` attribute units
+    tests methods.
+    """
+
+    def test_transformation_matrices(self):
+        """
+        Tests the *RGB* colourspaces transformation matrices consistency.
+        """
+
+        for colourspace in RGB_COLOURSPACES.values():
+            np.testing.assert_allclose(
+                np.linalg.inv(colourspace.to_XYZ),
+                colourspace.to_RGB,
+                atol=1e-8,
+                err_msg=colourspace.name)
+
+        adobe_wide_gamut_rgb = RGB_COLOURSPACES.get('Adobe Wide Gamut RGB')
+        np.testing.assert_allclose(
+            normalised_primary_matrix(adobe_wide_gamut_rgb.primaries,
+                                      adobe_wide_gamut_rgb.whitepoint),
+            adobe_wide_gamut_rgb.to_XYZ,
+            atol=1e-8)
+
+    def test_vectorised_transfer_functions(self):
+        """
+        Tests the vectorised *RGB* colourspaces transfer functions.
+        """
+
+        samples = np.linspace(0, 1, 64).reshape((4, 16))
+        for name in ('sRGB', 'Rec. 709', 'Adobe Wide Gamut RGB'):
+            colourspace = RGB_COLOURSPACES.get(name)
+
+            encoded = colourspace.transfer_function(samples)
+            np.testing.assert_almost_equal(
+                encoded,
+                np.reshape([colourspace.transfer_function(x)
+                            for x in np.ravel(samples)], samples.shape),
+                decimal=7)
+            np.testing.assert_almost_equal(
+                colourspace.inverse_transfer_function(encoded),
+                samples,
+                decimal=7)
+
+    def test_8_bit_transfer_functions(self):
+        """
+        Tests the *RGB* colourspaces 8 bit transfer functions.
+        """
+
+        samples = np.arange(256, dtype=np.uint8).reshape((16, 16))
+        for name, transfer_function_8_bit in (
+                ('Rec. 709', rec_709_transfer_function_8_bit),
+                ('Adobe Wide Gamut RGB',
+                 adobe_wide_gamut_rgb_transfer_function_8_bit)):
+            colourspace = RGB_COLOURSPACES.get(name)
+
+            encoded = transfer_function_8_bit(samples)
+            self.assertEqual(encoded.dtype, np.uint8)
+            self.assertEqual(encoded.shape, samples.shape)
+            np.testing.assert_array_equal(
+                encoded,
+                np.around(colourspace.transfer_function(samples / 255) *
+                          255))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -143,6 +143,7 @@ MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES = ILLUMINANTS.get(
     MUNSELL_DEFAULT_ILLUMINANT)
 
 _MUNSELL_SPECIFICATIONS_CACHE = None
+_MUNSELL_RENOTATION_XYY_CACHE = None
 _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
 _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
 
@@ -181,6 +182,31 @@ def _munsell_specifications():
     return _MUNSELL_SPECIFICATIONS_CACHE
 
 
+def _munsell_renotation_xyY():
+    """
+    Returns the *Munsell Renotation System* *CIE xyY* colourspace vectors
+    indexed by *Munsell* *Colorlab* specifications and caches them if not
+    existing.
+
+    Returns
+    -------
+    dict
+        *Munsell Renotation System* *CIE xyY* colourspace vectors.
+    """
+
+    global _MUNSELL_RENOTATION_XYY_CACHE
+    if _MUNSELL_RENOTATION_XYY_CACHE is None:
+        renotation = {}
+        for specification, munsell_colour in zip(_munsell_specifications(),
+                                                 MUNSELL_COLOURS_ALL):
+            # Keeping the first occurrence of a given specification.
+            if specification not in renotation:
+                renotation[specification] = munsell_colour[1]
+
+        _MUNSELL_RENOTATION_XYY_CACHE = renotation
+    return _MUNSELL_RENOTATION_XYY_CACHE
+
+
 def _munsell_value_ASTM_D1535_08_interpolator():
     """
     Returns the *Munsell* value interpolator for *ASTM D1535-08* method and
@@ -1188,10 +1214,9 @@ def xyY_from_renotation(specification):
     (0.71..., 1.41..., 0.23...)
     """
 
-    specifications = _munsell_specifications()
     try:
-        return MUNSELL_COLOURS_ALL[specifications.index(specification)][1]
-    except ValueError:
+        return _munsell_renotation_xyY()[specification]
+    except (KeyError, TypeError):
         # TODO: Should raise KeyError, need to check the tests.
         raise ValueError(
             ('"{0}" specification does not exists in '
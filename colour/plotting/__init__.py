@@ -7,6 +7,7 @@ from .dataset import *  # noqa
 from . import dataset
 from .common import (
     PLOTTING_RESOURCES_DIRECTORY,
+    PLOTTING_CACHE_DIRECTORY,
     DEFAULT_FIGURE_SIZE,
     DEFAULT_COLOUR_CYCLE,
     ColourParameter,
@@ -56,6 +57,7 @@ __all__ = []
 __all__ += dataset.__all__
 __all__ += [
     'PLOTTING_RESOURCES_DIRECTORY',
+    'PLOTTING_CACHE_DIRECTORY',
     'DEFAULT_FIGURE_SIZE',
     'DEFAULT_COLOUR_CYCLE',
     'ColourParameter',
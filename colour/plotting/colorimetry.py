@@ -22,6 +22,10 @@ Defines the colorimetry plotting objects:
 
 from __future__ import division
 
+try:
+    from functools import lru_cache
+except ImportError:
+    from backports.functools_lru_cache import lru_cache
 import matplotlib.pyplot
 import numpy as np
 import pylab
@@ -68,6 +72,7 @@ __all__ = ['get_cmfs',
            'blackbody_colours_plot']
 
 
+@lru_cache(maxsize=16)
 def get_cmfs(cmfs):
     """
     Returns the colour matching functions with given name.
@@ -93,7 +98,7 @@ def get_cmfs(cmfs):
     if cmfs is None:
         raise KeyError(
             ('"{0}" not found in factory colour matching functions: '
-             '"{1}".').format(name, sorted(cmfs.CMFS.keys())))
+             '"{1}".').format(name, sorted(CMFS.keys())))
     return cmfs
 
 
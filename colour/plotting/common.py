@@ -44,6 +44,7 @@ __status__ = 'Production'
 
 __all__ = [
     'PLOTTING_RESOURCES_DIRECTORY',
+    'PLOTTING_CACHE_DIRECTORY',
     'DEFAULT_FIGURE_SIZE',
     'DEFAULT_COLOUR_CYCLE',
     'ColourParameter',
@@ -66,6 +67,22 @@ Resources directory.
 RESOURCES_DIRECTORY : unicode
 """
 
+PLOTTING_CACHE_DIRECTORY = os.environ.get(
+    'COLOUR_PLOTTING_CACHE_DIRECTORY',
+    os.path.join(os.environ.get('XDG_CACHE_HOME',
+                                os.path.join(os.path.expanduser('~'),
+                                             '.cache')),
+                 'colour',
+                 'plotting'))
+"""
+Cache directory for expensive plots data, defaults to a *colour/plotting*
+sub-directory of the user cache directory and can be changed with the
+*COLOUR_PLOTTING_CACHE_DIRECTORY* environment variable, an empty value
+disables caching.
+
+PLOTTING_CACHE_DIRECTORY : unicode
+"""
+
 DEFAULT_FIGURE_SIZE = 14, 7
 """
 Default plots figure size.
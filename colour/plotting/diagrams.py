@@ -14,9 +14,14 @@ Defines the *CIE* chromaticity diagrams plotting objects:
 
 from __future__ import division
 
-import bisect
+import hashlib
+import math
 import os
 
+try:
+    from functools import lru_cache
+except ImportError:
+    from backports.functools_lru_cache import lru_cache
 import matplotlib
 import matplotlib.image
 import matplotlib.path
@@ -27,21 +32,18 @@ from colour.algebra import normalise
 from colour.colorimetry import ILLUMINANTS
 from colour.models import (
     UCS_uv_to_xy,
-    XYZ_to_UCS,
-    XYZ_to_xy,
-    UCS_to_uv,
     xy_to_XYZ,
-    XYZ_to_Luv,
-    Luv_to_uv,
     Luv_uv_to_xy,
     XYZ_to_sRGB)
 from colour.plotting import (
+    PLOTTING_CACHE_DIRECTORY,
     PLOTTING_RESOURCES_DIRECTORY,
     aspect,
     bounding_box,
     display,
     figure_size,
     get_cmfs)
+from colour.utilities import is_scipy_installed
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2014 - Colour Developers'
@@ -57,6 +59,470 @@ __all__ = ['CIE_1931_chromaticity_diagram_colours_plot',
            'CIE_1976_UCS_chromaticity_diagram_colours_plot',
            'CIE_1976_UCS_chromaticity_diagram_plot']
 
+_SPECTRAL_LOCUS_TOLERANCE = 1e-9
+_SPECTRAL_LOCUS_CHUNK_SIZE = 1024
+_COLOURS_PLOT_TILE_SIZE = 65536
+_COLOURS_PLOT_CACHE_VERSION = 2
+
+
+@lru_cache(maxsize=8)
+def _cmfs_xy(cmfs):
+    """
+    Returns the *xy* chromaticity coordinates of the spectral locus of given
+    standard observer colour matching functions.
+
+    Parameters
+    ----------
+    cmfs : unicode
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    ndarray, (N, 2)
+        Spectral locus *xy* chromaticity coordinates.
+
+    Notes
+    -----
+    -   Returned array is cached and thus read only.
+    """
+
+    XYZ = get_cmfs(cmfs).values
+    XYZ_sum = np.sum(XYZ, axis=-1)
+
+    illuminant = ILLUMINANTS.get(
+        'CIE 1931 2 Degree Standard Observer').get('D50')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xy = np.where((XYZ_sum == 0)[:, np.newaxis],
+                      illuminant,
+                      XYZ[:, 0:2] / XYZ_sum[:, np.newaxis])
+    xy.setflags(write=False)
+
+    return xy
+
+
+@lru_cache(maxsize=8)
+def _cmfs_UCS_uv(cmfs):
+    """
+    Returns the *CIE UCS* *uv* chromaticity coordinates of the spectral locus
+    of given standard observer colour matching functions.
+
+    Parameters
+    ----------
+    cmfs : unicode
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    ndarray, (N, 2)
+        Spectral locus *uv* chromaticity coordinates.
+
+    Notes
+    -----
+    -   Returned array is cached and thus read only.
+    """
+
+    X, Y, Z = np.transpose(get_cmfs(cmfs).values)
+
+    UVW = np.column_stack((2 / 3 * X, Y, 1 / 2 * (-X + 3 * Y + Z)))
+    uv = UVW[:, 0:2] / np.sum(UVW, axis=-1)[:, np.newaxis]
+    uv.setflags(write=False)
+
+    return uv
+
+
+@lru_cache(maxsize=8)
+def _cmfs_Luv_uv(cmfs):
+    """
+    Returns the *CIE Luv* *u"v"* chromaticity coordinates of the spectral
+    locus of given standard observer colour matching functions.
+
+    Parameters
+    ----------
+    cmfs : unicode
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    ndarray, (N, 2)
+        Spectral locus *u"v"* chromaticity coordinates.
+
+    Notes
+    -----
+    -   Returned array is cached and thus read only.
+    """
+
+    X, Y, Z = np.transpose(get_cmfs(cmfs).values)
+
+    denominator = X + 15 * Y + 3 * Z
+    uv = np.column_stack((4 * X / denominator, 9 * Y / denominator))
+    uv.setflags(write=False)
+
+    return uv
+
+
+@lru_cache(maxsize=8)
+def _spectral_locus_half_planes(locus, cmfs):
+    """
+    Returns the half-planes bounding the convex hull of the spectral locus of
+    given standard observer colour matching functions.
+
+    Parameters
+    ----------
+    locus : callable
+        Spectral locus chromaticity coordinates definition, e.g.
+        :def:`_cmfs_xy`.
+    cmfs : unicode
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    tuple
+        Half-planes normals ndarray, (2, E) and limits ndarray, (E,) so that
+        points within the convex hull satisfy
+        *np.dot(points, normals) <= limits*.
+    """
+
+    from scipy.spatial import ConvexHull
+
+    equations = ConvexHull(locus(cmfs)).equations
+
+    normals = np.ascontiguousarray(np.transpose(equations[:, 0:2]))
+    limits = _SPECTRAL_LOCUS_TOLERANCE - equations[:, 2]
+    normals.setflags(write=False)
+    limits.setflags(write=False)
+
+    return normals, limits
+
+
+def _path_contains_points(path, points):
+    """
+    Returns if given points are within given path.
+
+    *Matplotlib* versions lacking
+    :meth:`matplotlib.path.Path.contains_points` method are supported by
+    testing the points one at a time against a single probe path whose
+    vertices are updated in place.
+
+    Parameters
+    ----------
+    path : Path
+        Path to test the points against.
+    points : array_like, (N, 2)
+        Points to test.
+
+    Returns
+    -------
+    ndarray, (N,)
+        Are points within the path.
+    """
+
+    if hasattr(path, 'contains_points'):
+        return path.contains_points(points)
+
+    vertices = np.zeros((2, 2))
+    probe = matplotlib.path.Path(vertices)
+
+    within = np.zeros(len(points), dtype=np.bool_)
+    for i, point in enumerate(points):
+        vertices[:] = point
+        within[i] = path.contains_path(probe)
+
+    return within
+
+
+def _within_spectral_locus(points, locus, cmfs):
+    """
+    Returns if given points are within the spectral locus of given standard
+    observer colour matching functions.
+
+    The test is performed against the spectral locus convex hull half-planes
+    if *scipy* is installed, the spectral locus path is used otherwise.
+
+    Parameters
+    ----------
+    points : array_like, (N, 2)
+        Points to test.
+    locus : callable
+        Spectral locus chromaticity coordinates definition, e.g.
+        :def:`_cmfs_xy`.
+    cmfs : unicode
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    ndarray, (N,)
+        Are points within the spectral locus.
+    """
+
+    points = np.asarray(points)
+
+    if not is_scipy_installed():
+        return _path_contains_points(matplotlib.path.Path(locus(cmfs)),
+                                     points)
+
+    normals, limits = _spectral_locus_half_planes(locus, cmfs)
+
+    coordinates = locus(cmfs)
+    within = np.all(np.logical_and(points >= np.min(coordinates, axis=0),
+                                   points <= np.max(coordinates, axis=0)),
+                    axis=-1)
+
+    candidates = points[within]
+    inside = np.empty(len(candidates), dtype=np.bool_)
+    # Processing the points in chunks keeps the (chunk, E) intermediate
+    # array small enough to stay in cache.
+    for i in range(0, len(candidates), _SPECTRAL_LOCUS_CHUNK_SIZE):
+        chunk = slice(i, i + _SPECTRAL_LOCUS_CHUNK_SIZE)
+        inside[chunk] = np.all(np.dot(candidates[chunk], normals) <= limits,
+                               axis=-1)
+
+    within[within] = inside
+
+    return within
+
+
+def _colours_plot_image(spacing, locus, cmfs, to_xy, illuminant):
+    """
+    Returns the RGBA image of the colours within the spectral locus of given
+    standard observer colour matching functions.
+
+    The sampling grid is processed in tiles of about
+    :attr:`_COLOURS_PLOT_TILE_SIZE` samples so that the intermediate arrays
+    of the colour conversions remain small.
+
+    Parameters
+    ----------
+    spacing : numeric
+        Spacing between samples.
+    locus : callable
+        Spectral locus chromaticity coordinates definition, e.g.
+        :def:`_cmfs_xy`.
+    cmfs : unicode
+        Standard observer colour matching functions.
+    to_xy : callable or None
+        Definition converting the diagram chromaticity coordinates to *xy*
+        chromaticity coordinates, *None* if they are already *xy*
+        chromaticity coordinates.
+    illuminant : array_like
+        Reference *illuminant* chromaticity coordinates.
+
+    Returns
+    -------
+    ndarray, (N, N, 4)
+        Colours image, samples outside the spectral locus are transparent.
+    """
+
+    samples = np.arange(0, 1, spacing)
+    count = len(samples)
+
+    image = np.zeros((count, count, 4))
+    rows = max(1, _COLOURS_PLOT_TILE_SIZE // count)
+    for row in range(0, count, rows):
+        i, j = np.meshgrid(samples, samples[row:row + rows])
+        ij = np.column_stack((np.ravel(i), np.ravel(j)))
+        within = _within_spectral_locus(ij, locus, cmfs)
+
+        xy = ij[within] if to_xy is None else to_xy(ij[within])
+        RGB = normalise(XYZ_to_sRGB(xy_to_XYZ(xy), illuminant), axis=-1)
+
+        # Image rows slices are contiguous, thus the reshape is a view.
+        tile = np.reshape(image[row:row + rows], (-1, 4))
+        tile[within, 0:3] = RGB
+        tile[within, 3] = 1
+
+    return image
+
+
+def _colours_plot_cache_path(diagram, spacing, cmfs):
+    """
+    Returns the path of the cached image of given chromaticity diagram
+    colours plot.
+
+    The image is stored in :attr:`PLOTTING_CACHE_DIRECTORY` directory and
+    named after a hash of the given arguments,
+    :attr:`_COLOURS_PLOT_CACHE_VERSION` attribute and whether *scipy* is
+    installed: :def:`_within_spectral_locus` definition classifies the
+    samples close to the spectral locus differently depending on it.
+
+    Parameters
+    ----------
+    diagram : unicode
+        Chromaticity diagram name.
+    spacing : numeric
+        Spacing between samples.
+    cmfs : unicode
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    unicode or None
+        Cached image path, *None* if caching is disabled.
+    """
+
+    if not PLOTTING_CACHE_DIRECTORY:
+        return None
+
+    key = hashlib.sha1(
+        repr((_COLOURS_PLOT_CACHE_VERSION,
+              is_scipy_installed(),
+              diagram,
+              spacing,
+              cmfs)).encode('utf-8')).hexdigest()
+
+    return os.path.join(
+        PLOTTING_CACHE_DIRECTORY,
+        '{0}_Chromaticity_Diagram_Colours_{1}.png'.format(diagram, key[:16]))
+
+
+def _colours_plot_from_cache(path):
+    """
+    Reads the cached image at given path if existing.
+
+    Parameters
+    ----------
+    path : unicode or None
+        Cached image path.
+
+    Returns
+    -------
+    ndarray or None
+        Cached image, *None* if unavailable.
+    """
+
+    if path is None or not os.path.isfile(path):
+        return None
+
+    try:
+        return matplotlib.image.imread(path)
+    except (IOError, OSError, RuntimeError, ValueError):
+        return None
+
+
+def _colours_plot_to_cache(path, image):
+    """
+    Writes given image to given cache path.
+
+    Failing to write the image, e.g. because the cache directory is read
+    only, is silently ignored.
+
+    Parameters
+    ----------
+    path : unicode or None
+        Cached image path.
+    image : ndarray, (N, N, 4)
+        Image to cache.
+
+    Returns
+    -------
+    bool
+        Is image written.
+    """
+
+    if path is None:
+        return False
+
+    try:
+        directory = os.path.dirname(path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        # Writing to a temporary file first so that an interrupted write
+        # doesn't leave a truncated image behind.
+        temporary_path = '{0}.{1}.tmp'.format(path, os.getpid())
+        matplotlib.image.imsave(temporary_path, image, format='png')
+        os.rename(temporary_path, path)
+    except (IOError, OSError):
+        return False
+
+    return True
+
+
+def _chromaticity_diagram_plot(diagram, locus, cmfs, labels, **kwargs):
+    """
+    Plots given chromaticity diagram with its spectral locus and wavelengths
+    labels.
+
+    Parameters
+    ----------
+    diagram : unicode
+        Chromaticity diagram name used to retrieve the diagram colours image
+        from :attr:`PLOTTING_RESOURCES_DIRECTORY`.
+    locus : callable
+        Spectral locus chromaticity coordinates definition, e.g.
+        :def:`_cmfs_xy`.
+    cmfs : unicode
+        Standard observer colour matching functions used for diagram bounds.
+    labels : array_like
+        Wavelengths to label on the spectral locus.
+    \*\*kwargs : \*\*
+        Keywords arguments.
+
+    Returns
+    -------
+    bool
+        Definition success.
+    """
+
+    cmfs, name = get_cmfs(cmfs), cmfs
+
+    image = matplotlib.image.imread(
+        os.path.join(PLOTTING_RESOURCES_DIRECTORY,
+                     '{0}_Chromaticity_Diagram_{1}_Small.png'.format(
+                         diagram, cmfs.name.replace(' ', '_'))))
+    pylab.imshow(image, interpolation='nearest', extent=(0, 1, 0, 1))
+
+    wavelengths = cmfs.wavelengths
+    equal_energy = (1 / 3, 1 / 3)
+
+    coordinates = locus(name)
+    x, y = np.transpose(coordinates)
+
+    pylab.plot(x, y, color='black', linewidth=2)
+    pylab.plot((x[-1], x[0]), (y[-1], y[0]), color='black', linewidth=2)
+
+    index = np.searchsorted(wavelengths, labels, side='right')
+    left = np.clip(index - 1, 0, len(wavelengths) - 1)
+    right = np.clip(index, 0, len(wavelengths) - 1)
+    directions = coordinates[right] - coordinates[left]
+
+    for i, label in enumerate(labels):
+        x, y = coordinates[left[i]]
+        pylab.plot(x, y, 'o', color='black', linewidth=2)
+
+        dx, dy = directions[i]
+
+        # Normal pointing away from the equal energy point.
+        sign = (1 if (x - equal_energy[0]) * -dy +
+                (y - equal_energy[1]) * dx > 0 else -1)
+        normal_x, normal_y = -sign * dy, sign * dx
+        length = 25 * math.hypot(normal_x, normal_y)
+        normal_x, normal_y = normal_x / length, normal_y / length
+
+        pylab.plot([x, x + normal_x * 0.75],
+                   [y, y + normal_y * 0.75],
+                   color='black',
+                   linewidth=1.5)
+        pylab.text(x + normal_x,
+                   y + normal_y,
+                   label,
+                   clip_on=True,
+                   ha='left' if normal_x >= 0 else 'right',
+                   va='center',
+                   fontdict={'size': 'small'})
+
+    settings = {
+        'x_ticker': True,
+        'y_ticker': True,
+        'grid': True,
+        'bbox_inches': 'tight',
+        'pad_inches': 0}
+    settings.update(kwargs)
+
+    bounding_box(**settings)
+    aspect(**settings)
+
+    return display(**settings)
+
 
 @figure_size((32, 32))
 def CIE_1931_chromaticity_diagram_colours_plot(
@@ -70,9 +536,10 @@ def CIE_1931_chromaticity_diagram_colours_plot(
     Parameters
     ----------
     surface : numeric, optional
-        Generated markers surface.
+        Generated markers surface, unused since the colours are rasterized
+        into an image, kept for compatibility.
     spacing : numeric, optional
-        Spacing between markers.
+        Spacing between samples.
     cmfs : unicode, optional
         Standard observer colour matching functions used for diagram bounds.
     \*\*kwargs : \*\*
@@ -91,27 +558,20 @@ def CIE_1931_chromaticity_diagram_colours_plot(
 
     cmfs, name = get_cmfs(cmfs), cmfs
 
-    illuminant = ILLUMINANTS.get(
-        'CIE 1931 2 Degree Standard Observer').get('E')
-
-    XYZs = [value for key, value in cmfs]
+    cache = _colours_plot_cache_path('CIE_1931', spacing, name)
+    image = _colours_plot_from_cache(cache)
+    if image is None:
+        illuminant = ILLUMINANTS.get(
+            'CIE 1931 2 Degree Standard Observer').get('E')
 
-    x, y = tuple(zip(*([XYZ_to_xy(x) for x in XYZs])))
+        image = _colours_plot_image(
+            spacing, _cmfs_xy, name, None, illuminant)
+        _colours_plot_to_cache(cache, image)
 
-    path = matplotlib.path.Path(tuple(zip(x, y)))
-    x_dot, y_dot, colours = [], [], []
-    for i in np.arange(0, 1, spacing):
-        for j in np.arange(0, 1, spacing):
-            if path.contains_path(matplotlib.path.Path([[i, j], [i, j]])):
-                x_dot.append(i)
-                y_dot.append(j)
-
-                XYZ = xy_to_XYZ((i, j))
-                RGB = normalise(XYZ_to_sRGB(XYZ, illuminant))
-
-                colours.append(RGB)
-
-    pylab.scatter(x_dot, y_dot, color=colours, s=surface)
+    pylab.imshow(image,
+                 interpolation='nearest',
+                 extent=(0, 1, 0, 1),
+                 origin='lower')
 
     settings = {'no_ticks': True,
                 'bounding_box': [0, 1, 0, 1],
@@ -150,86 +610,19 @@ def CIE_1931_chromaticity_diagram_plot(
 
     """
 
-    cmfs, name = get_cmfs(cmfs), cmfs
-
-    image = matplotlib.image.imread(
-        os.path.join(PLOTTING_RESOURCES_DIRECTORY,
-                     'CIE_1931_Chromaticity_Diagram_{0}_Small.png'.format(
-                         cmfs.name.replace(' ', '_'))))
-    pylab.imshow(image, interpolation='nearest', extent=(0, 1, 0, 1))
-
     labels = (
         [390, 460, 470, 480, 490, 500, 510, 520, 540, 560, 580, 600, 620,
          700])
 
-    wavelengths = cmfs.wavelengths
-    equal_energy = np.array([1 / 3] * 2)
-
-    XYZs = [value for key, value in cmfs]
-
-    x, y = tuple(zip(*([XYZ_to_xy(x) for x in XYZs])))
-
-    wavelengths_chromaticity_coordinates = dict(
-        tuple(zip(wavelengths, tuple(zip(x, y)))))
-
-    pylab.plot(x, y, color='black', linewidth=2)
-    pylab.plot((x[-1], x[0]), (y[-1], y[0]), color='black', linewidth=2)
-
-    for label in labels:
-        x, y = wavelengths_chromaticity_coordinates.get(label)
-        pylab.plot(x, y, 'o', color='black', linewidth=2)
-
-        index = bisect.bisect(wavelengths, label)
-        left = wavelengths[index - 1] if index >= 0 else wavelengths[index]
-        right = (wavelengths[index]
-                 if index < len(wavelengths) else
-                 wavelengths[-1])
-
-        dx = (wavelengths_chromaticity_coordinates.get(right)[0] -
-              wavelengths_chromaticity_coordinates.get(left)[0])
-        dy = (wavelengths_chromaticity_coordinates.get(right)[1] -
-              wavelengths_chromaticity_coordinates.get(left)[1])
-
-        norme = lambda x: x / np.linalg.norm(x)
-
-        xy = np.array([x, y])
-        direction = np.array((-dy, dx))
-
-        normal = (np.array((-dy, dx))
-                  if np.dot(norme(xy - equal_energy),
-                            norme(direction)) > 0 else
-                  np.array((dy, -dx)))
-        normal = norme(normal)
-        normal /= 25
-
-        pylab.plot([x, x + normal[0] * 0.75],
-                   [y, y + normal[1] * 0.75],
-                   color='black',
-                   linewidth=1.5)
-        pylab.text(x + normal[0],
-                   y + normal[1],
-                   label,
-                   clip_on=True,
-                   ha='left' if normal[0] >= 0 else 'right',
-                   va='center',
-                   fontdict={'size': 'small'})
-
     settings = {
-        'title': 'CIE 1931 Chromaticity Diagram - {0}'.format(name),
+        'title': 'CIE 1931 Chromaticity Diagram - {0}'.format(cmfs),
         'x_label': 'CIE x',
         'y_label': 'CIE y',
-        'x_ticker': True,
-        'y_ticker': True,
-        'grid': True,
-        'bounding_box': [-0.1, 0.9, -0.1, 0.9],
-        'bbox_inches': 'tight',
-        'pad_inches': 0}
+        'bounding_box': [-0.1, 0.9, -0.1, 0.9]}
     settings.update(kwargs)
 
-    bounding_box(**settings)
-    aspect(**settings)
-
-    return display(**settings)
+    return _chromaticity_diagram_plot(
+        'CIE_1931', _cmfs_xy, cmfs, labels, **settings)
 
 
 @figure_size((32, 32))
@@ -244,9 +637,10 @@ def CIE_1960_UCS_chromaticity_diagram_colours_plot(
     Parameters
     ----------
     surface : numeric, optional
-        Generated markers surface.
+        Generated markers surface, unused since the colours are rasterized
+        into an image, kept for compatibility.
     spacing : numeric, optional
-        Spacing between markers.
+        Spacing between samples.
     cmfs : unicode, optional
         Standard observer colour matching functions used for diagram bounds.
     \*\*kwargs : \*\*
@@ -265,27 +659,20 @@ def CIE_1960_UCS_chromaticity_diagram_colours_plot(
 
     cmfs, name = get_cmfs(cmfs), cmfs
 
-    illuminant = ILLUMINANTS.get(
-        'CIE 1931 2 Degree Standard Observer').get('E')
+    cache = _colours_plot_cache_path('CIE_1960_UCS', spacing, name)
+    image = _colours_plot_from_cache(cache)
+    if image is None:
+        illuminant = ILLUMINANTS.get(
+            'CIE 1931 2 Degree Standard Observer').get('E')
 
-    UVWs = [XYZ_to_UCS(value) for key, value in cmfs]
+        image = _colours_plot_image(
+            spacing, _cmfs_UCS_uv, name, UCS_uv_to_xy, illuminant)
+        _colours_plot_to_cache(cache, image)
 
-    u, v = tuple(zip(*([UCS_to_uv(x) for x in UVWs])))
-
-    path = matplotlib.path.Path(tuple(zip(u, v)))
-    x_dot, y_dot, colours = [], [], []
-    for i in np.arange(0, 1, spacing):
-        for j in np.arange(0, 1, spacing):
-            if path.contains_path(matplotlib.path.Path([[i, j], [i, j]])):
-                x_dot.append(i)
-                y_dot.append(j)
-
-                XYZ = xy_to_XYZ(UCS_uv_to_xy((i, j)))
-                RGB = normalise(XYZ_to_sRGB(XYZ, illuminant))
-
-                colours.append(RGB)
-
-    pylab.scatter(x_dot, y_dot, color=colours, s=surface)
+    pylab.imshow(image,
+                 interpolation='nearest',
+                 extent=(0, 1, 0, 1),
+                 origin='lower')
 
     settings = {'no_ticks': True,
                 'bounding_box': [0, 1, 0, 1],
@@ -323,85 +710,18 @@ def CIE_1960_UCS_chromaticity_diagram_plot(
     True
     """
 
-    cmfs, name = get_cmfs(cmfs), cmfs
-
-    image = matplotlib.image.imread(
-        os.path.join(PLOTTING_RESOURCES_DIRECTORY,
-                     'CIE_1960_UCS_Chromaticity_Diagram_{0}_Small.png'.format(
-                         cmfs.name.replace(' ', '_'))))
-    pylab.imshow(image, interpolation='nearest', extent=(0, 1, 0, 1))
-
     labels = [420, 430, 440, 450, 460, 470, 480, 490, 500, 510, 520, 530,
               540, 550, 560, 570, 580, 590, 600, 610, 620, 630, 640, 680]
 
-    wavelengths = cmfs.wavelengths
-    equal_energy = np.array([1 / 3] * 2)
-
-    UVWs = [XYZ_to_UCS(value) for key, value in cmfs]
-
-    u, v = tuple(zip(*([UCS_to_uv(x) for x in UVWs])))
-
-    wavelengths_chromaticity_coordinates = dict(
-        tuple(zip(wavelengths, tuple(zip(u, v)))))
-
-    pylab.plot(u, v, color='black', linewidth=2)
-    pylab.plot((u[-1], u[0]), (v[-1], v[0]), color='black', linewidth=2)
-
-    for label in labels:
-        u, v = wavelengths_chromaticity_coordinates.get(label)
-        pylab.plot(u, v, 'o', color='black', linewidth=2)
-
-        index = bisect.bisect(wavelengths, label)
-        left = wavelengths[index - 1] if index >= 0 else wavelengths[index]
-        right = (wavelengths[index]
-                 if index < len(wavelengths) else
-                 wavelengths[-1])
-
-        dx = (wavelengths_chromaticity_coordinates.get(right)[0] -
-              wavelengths_chromaticity_coordinates.get(left)[0])
-        dy = (wavelengths_chromaticity_coordinates.get(right)[1] -
-              wavelengths_chromaticity_coordinates.get(left)[1])
-
-        norme = lambda x: x / np.linalg.norm(x)
-
-        uv = np.array([u, v])
-        direction = np.array((-dy, dx))
-
-        normal = (np.array((-dy, dx))
-                  if np.dot(norme(uv - equal_energy),
-                            norme(direction)) > 0 else
-                  np.array((dy, -dx)))
-        normal = norme(normal)
-        normal /= 25
-
-        pylab.plot([u, u + normal[0] * 0.75],
-                   [v, v + normal[1] * 0.75],
-                   color='black',
-                   linewidth=1.5)
-        pylab.text(u + normal[0],
-                   v + normal[1],
-                   label,
-                   clip_on=True,
-                   ha='left' if normal[0] >= 0 else 'right',
-                   va='center',
-                   fontdict={'size': 'small'})
-
     settings = {
-        'title': 'CIE 1960 UCS Chromaticity Diagram - {0}'.format(name),
+        'title': 'CIE 1960 UCS Chromaticity Diagram - {0}'.format(cmfs),
         'x_label': 'CIE u',
         'y_label': 'CIE v',
-        'x_ticker': True,
-        'y_ticker': True,
-        'grid': True,
-        'bounding_box': [-0.075, 0.675, -0.15, 0.6],
-        'bbox_inches': 'tight',
-        'pad_inches': 0}
+        'bounding_box': [-0.075, 0.675, -0.15, 0.6]}
     settings.update(kwargs)
 
-    bounding_box(**settings)
-    aspect(**settings)
-
-    return display(**settings)
+    return _chromaticity_diagram_plot(
+        'CIE_1960_UCS', _cmfs_UCS_uv, cmfs, labels, **settings)
 
 
 @figure_size((32, 32))
@@ -416,9 +736,10 @@ def CIE_1976_UCS_chromaticity_diagram_colours_plot(
     Parameters
     ----------
     surface : numeric, optional
-        Generated markers surface.
+        Generated markers surface, unused since the colours are rasterized
+        into an image, kept for compatibility.
     spacing : numeric, optional
-        Spacing between markers.
+        Spacing between samples.
     cmfs : unicode, optional
         Standard observer colour matching functions used for diagram bounds.
     \*\*kwargs : \*\*
@@ -437,27 +758,20 @@ def CIE_1976_UCS_chromaticity_diagram_colours_plot(
 
     cmfs, name = get_cmfs(cmfs), cmfs
 
-    illuminant = ILLUMINANTS.get(
-        'CIE 1931 2 Degree Standard Observer').get('D50')
-
-    Luvs = [XYZ_to_Luv(value, illuminant) for key, value in cmfs]
+    cache = _colours_plot_cache_path('CIE_1976_UCS', spacing, name)
+    image = _colours_plot_from_cache(cache)
+    if image is None:
+        illuminant = ILLUMINANTS.get(
+            'CIE 1931 2 Degree Standard Observer').get('D50')
 
-    u, v = tuple(zip(*([Luv_to_uv(x) for x in Luvs])))
+        image = _colours_plot_image(
+            spacing, _cmfs_Luv_uv, name, Luv_uv_to_xy, illuminant)
+        _colours_plot_to_cache(cache, image)
 
-    path = matplotlib.path.Path(tuple(zip(u, v)))
-    x_dot, y_dot, colours = [], [], []
-    for i in np.arange(0, 1, spacing):
-        for j in np.arange(0, 1, spacing):
-            if path.contains_path(matplotlib.path.Path([[i, j], [i, j]])):
-                x_dot.append(i)
-                y_dot.append(j)
-
-                XYZ = xy_to_XYZ(Luv_uv_to_xy((i, j)))
-                RGB = normalise(XYZ_to_sRGB(XYZ, illuminant))
-
-                colours.append(RGB)
-
-    pylab.scatter(x_dot, y_dot, color=colours, s=surface)
+    pylab.imshow(image,
+                 interpolation='nearest',
+                 extent=(0, 1, 0, 1),
+                 origin='lower')
 
     settings = {'no_ticks': True,
                 'bounding_box': [0, 1, 0, 1],
@@ -495,85 +809,15 @@ def CIE_1976_UCS_chromaticity_diagram_plot(
     True
     """
 
-    cmfs, name = get_cmfs(cmfs), cmfs
-
-    image = matplotlib.image.imread(
-        os.path.join(PLOTTING_RESOURCES_DIRECTORY,
-                     'CIE_1976_UCS_Chromaticity_Diagram_{0}_Small.png'.format(
-                         cmfs.name.replace(' ', '_'))))
-    pylab.imshow(image, interpolation='nearest', extent=(0, 1, 0, 1))
-
     labels = [420, 430, 440, 450, 460, 470, 480, 490, 500, 510, 520, 530,
               540, 550, 560, 570, 580, 590, 600, 610, 620, 630, 640, 680]
 
-    wavelengths = cmfs.wavelengths
-    equal_energy = np.array([1 / 3] * 2)
-
-    illuminant = ILLUMINANTS.get(
-        'CIE 1931 2 Degree Standard Observer').get('D50')
-
-    Luvs = [XYZ_to_Luv(value, illuminant) for key, value in cmfs]
-
-    u, v = tuple(zip(*([Luv_to_uv(x) for x in Luvs])))
-
-    wavelengths_chromaticity_coordinates = dict(zip(wavelengths,
-                                                    tuple(zip(u, v))))
-
-    pylab.plot(u, v, color='black', linewidth=2)
-    pylab.plot((u[-1], u[0]), (v[-1], v[0]), color='black', linewidth=2)
-
-    for label in labels:
-        u, v = wavelengths_chromaticity_coordinates.get(label)
-        pylab.plot(u, v, 'o', color='black', linewidth=2)
-
-        index = bisect.bisect(wavelengths, label)
-        left = wavelengths[index - 1] if index >= 0 else wavelengths[index]
-        right = (wavelengths[index]
-                 if index < len(wavelengths) else
-                 wavelengths[-1])
-
-        dx = (wavelengths_chromaticity_coordinates.get(right)[0] -
-              wavelengths_chromaticity_coordinates.get(left)[0])
-        dy = (wavelengths_chromaticity_coordinates.get(right)[1] -
-              wavelengths_chromaticity_coordinates.get(left)[1])
-
-        norme = lambda x: x / np.linalg.norm(x)
-
-        uv = np.array([u, v])
-        direction = np.array((-dy, dx))
-
-        normal = (np.array((-dy, dx))
-                  if np.dot(norme(uv - equal_energy),
-                            norme(direction)) > 0 else
-                  np.array((dy, -dx)))
-        normal = norme(normal)
-        normal /= 25
-
-        pylab.plot([u, u + normal[0] * 0.75],
-                   [v, v + normal[1] * 0.75],
-                   color='black',
-                   linewidth=1.5)
-        pylab.text(u + normal[0],
-                   v + normal[1],
-                   label,
-                   clip_on=True,
-                   ha='left' if normal[0] >= 0 else 'right',
-                   va='center',
-                   fontdict={'size': 'small'})
-
     settings = {
-        'title': 'CIE 1976 UCS Chromaticity Diagram - {0}'.format(name),
+        'title': 'CIE 1976 UCS Chromaticity Diagram - {0}'.format(cmfs),
         'x_label': 'CIE u"',
         'y_label': 'CIE v"',
-        'x_ticker': True,
-        'y_ticker': True,
-        'grid': True,
-        'bounding_box': [-0.1, .7, -.1, .7],
-        'bbox_inches': 'tight',
-        'pad_inches': 0}
+        'bounding_box': [-0.1, .7, -.1, .7]}
     settings.update(kwargs)
 
-    bounding_box(**settings)
-    aspect(**settings)
-
-    return display(**settings)
+    return _chromaticity_diagram_plot(
+        'CIE_1976_UCS', _cmfs_Luv_uv, cmfs, labels, **settings)
@@ -18,6 +18,7 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = ['is_scipy_installed',
+           'is_numba_installed',
            'is_string']
 
 
@@ -55,6 +56,38 @@ def is_scipy_installed(raise_exception=False):
         return False
 
 
+def is_numba_installed(raise_exception=False):
+    """
+    Returns if *numba* is installed and available.
+
+    Parameters
+    ----------
+    raise_exception : bool
+        Raise exception if *numba* is unavailable.
+
+    Returns
+    -------
+    bool
+        Is *numba* installed.
+
+    Raises
+    ------
+    ImportError
+        If *numba* is not installed.
+    """
+
+    try:
+        # Importing *numba* Api features used in *Colour*.
+        from numba import njit  # noqa
+
+        return True
+    except ImportError as error:
+        if raise_exception:
+            raise ImportError(('"numba" or specific "numba" Api features '
+                               'are not available: "{0}".').format(error))
+        return False
+
+
 def is_string(data):
     """
     Returns if given data is a *string_like* variable
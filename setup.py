@@ -44,7 +44,7 @@ if sys.version_info[:2] <= (2, 6):
         'ordereddict>=1.1',
         'unittest2>=0.5.1']
 
-OPTIONAL_REQUIREMENTS = ['scipy>=0.14.0']
+OPTIONAL_REQUIREMENTS = ['numba>=0.34.0', 'scipy>=0.14.0']
 
 DOCS_REQUIREMENTS = ['sphinx>=1.2.2',
                      'sphinxcontrib-napoleon>0.2.8',